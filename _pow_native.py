@@ -0,0 +1,74 @@
+"""
+Native Proof of Work Backend
+
+This module binds the C nonce scanner in pow_sha256_shani.c through ctypes.
+The shared library is optional: when it has not been built, `available` is
+False and callers fall back to the pure-Python search.
+"""
+
+import ctypes
+import logging
+import os
+
+logger = logging.getLogger(__name__)
+
+# Default location of the compiled scanner, next to this module
+LIBRARY_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'pow_sha256_shani.so')
+
+# Sentinel returned by find_nonce when no nonce in the batch matched
+NOT_FOUND = 2 ** 64 - 1
+
+# Nonces scanned per native call
+BATCH_SIZE = 1 << 20
+
+
+def _load_library():
+    """
+    Load the native scanner and declare its signatures.
+
+    Returns:
+        The loaded library, or None if it is not available
+    """
+    path = os.environ.get('POW_NATIVE_LIB', LIBRARY_PATH)
+    try:
+        lib = ctypes.CDLL(path)
+    except OSError as e:
+        logger.debug(f"Native proof of work backend not loaded: {e}")
+        return None
+
+    lib.find_nonce.argtypes = [ctypes.c_char_p, ctypes.c_size_t, ctypes.c_uint64,
+                               ctypes.c_uint64, ctypes.c_uint32]
+    lib.find_nonce.restype = ctypes.c_uint64
+    lib.pow_uses_shani.argtypes = []
+    lib.pow_uses_shani.restype = ctypes.c_int
+
+    logger.info(f"Loaded native proof of work backend "
+                f"({'SHA-NI' if lib.pow_uses_shani() else 'scalar'})")
+    return lib
+
+
+_lib = _load_library()
+available = _lib is not None
+
+
+def find_nonce(last_proof: int, difficulty: int, start: int = 0) -> int:
+    """
+    Find the smallest proof >= start such that hash(last_proof, proof)
+    has `difficulty` leading zero hex digits.
+
+    Args:
+        last_proof: Previous proof
+        difficulty: Number of leading zero hex digits required
+        start: First nonce to try
+
+    Returns:
+        New proof value
+    """
+    prefix = str(last_proof).encode()
+    nonce = start
+
+    while True:
+        found = _lib.find_nonce(prefix, len(prefix), nonce, BATCH_SIZE, difficulty)
+        if found != NOT_FOUND:
+            return found
+        nonce += BATCH_SIZE
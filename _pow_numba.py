@@ -0,0 +1,179 @@
+"""
+Numba Proof of Work Backend
+
+This module provides a multi-core nonce search compiled with Numba. The nonce
+space is split into fixed-size chunks that are scanned in parallel with
+`prange`; each chunk runs a Numba implementation of SHA-256 over
+`str(last_proof) + str(nonce)`. Numba is optional: when it is not installed,
+`available` is False and callers fall back to another backend.
+"""
+
+import logging
+
+try:
+    import numba
+    import numpy as np
+    from numba import njit, prange
+except ImportError:
+    numba = None
+
+logger = logging.getLogger(__name__)
+
+available = numba is not None
+
+# Nonces scanned by one parallel task
+CHUNK_SIZE = 1 << 16
+
+# Parallel tasks per search round, per thread
+CHUNKS_PER_THREAD = 4
+
+if available:
+    _MASK = 0xFFFFFFFF
+    _NO_HIT = np.iinfo(np.int64).max
+
+    _IV = np.array([
+        0x6a09e667, 0xbb67ae85, 0x3c6ef372, 0xa54ff53a,
+        0x510e527f, 0x9b05688c, 0x1f83d9ab, 0x5be0cd19,
+    ], dtype=np.int64)
+
+    _K = np.array([
+        0x428a2f98, 0x71374491, 0xb5c0fbcf, 0xe9b5dba5, 0x3956c25b, 0x59f111f1, 0x923f82a4, 0xab1c5ed5,
+        0xd807aa98, 0x12835b01, 0x243185be, 0x550c7dc3, 0x72be5d74, 0x80deb1fe, 0x9bdc06a7, 0xc19bf174,
+        0xe49b69c1, 0xefbe4786, 0x0fc19dc6, 0x240ca1cc, 0x2de92c6f, 0x4a7484aa, 0x5cb0a9dc, 0x76f988da,
+        0x983e5152, 0xa831c66d, 0xb00327c8, 0xbf597fc7, 0xc6e00bf3, 0xd5a79147, 0x06ca6351, 0x14292967,
+        0x27b70a85, 0x2e1b2138, 0x4d2c6dfc, 0x53380d13, 0x650a7354, 0x766a0abb, 0x81c2c92e, 0x92722c85,
+        0xa2bfe8a1, 0xa81a664b, 0xc24b8b70, 0xc76c51a3, 0xd192e819, 0xd6990624, 0xf40e3585, 0x106aa070,
+        0x19a4c116, 0x1e376c08, 0x2748774c, 0x34b0bcb5, 0x391c0cb3, 0x4ed8aa4a, 0x5b9cca4f, 0x682e6ff3,
+        0x748f82ee, 0x78a5636f, 0x84c87814, 0x8cc70208, 0x90befffa, 0xa4506ceb, 0xbef9a3f7, 0xc67178f2,
+    ], dtype=np.int64)
+
+    @njit(cache=True, inline='always')
+    def _rotr(x, n):
+        return ((x >> n) | (x << (32 - n))) & _MASK
+
+    @njit(cache=True)
+    def _compress(state, buf, offset, w):
+        """Run one SHA-256 compression over buf[offset:offset + 64]."""
+        for i in range(16):
+            j = offset + 4 * i
+            w[i] = (np.int64(buf[j]) << 24) | (np.int64(buf[j + 1]) << 16) | \
+                   (np.int64(buf[j + 2]) << 8) | np.int64(buf[j + 3])
+        for i in range(16, 64):
+            s0 = _rotr(w[i - 15], 7) ^ _rotr(w[i - 15], 18) ^ (w[i - 15] >> 3)
+            s1 = _rotr(w[i - 2], 17) ^ _rotr(w[i - 2], 19) ^ (w[i - 2] >> 10)
+            w[i] = (w[i - 16] + s0 + w[i - 7] + s1) & _MASK
+
+        a, b, c, d = state[0], state[1], state[2], state[3]
+        e, f, g, h = state[4], state[5], state[6], state[7]
+        for i in range(64):
+            s1 = _rotr(e, 6) ^ _rotr(e, 11) ^ _rotr(e, 25)
+            ch = (e & f) ^ (~e & g & _MASK)
+            t1 = (h + s1 + ch + _K[i] + w[i]) & _MASK
+            s0 = _rotr(a, 2) ^ _rotr(a, 13) ^ _rotr(a, 22)
+            maj = (a & b) ^ (a & c) ^ (b & c)
+            t2 = (s0 + maj) & _MASK
+            h = g
+            g = f
+            f = e
+            e = (d + t1) & _MASK
+            d = c
+            c = b
+            b = a
+            a = (t1 + t2) & _MASK
+
+        state[0] = (state[0] + a) & _MASK
+        state[1] = (state[1] + b) & _MASK
+        state[2] = (state[2] + c) & _MASK
+        state[3] = (state[3] + d) & _MASK
+        state[4] = (state[4] + e) & _MASK
+        state[5] = (state[5] + f) & _MASK
+        state[6] = (state[6] + g) & _MASK
+        state[7] = (state[7] + h) & _MASK
+
+    @njit(cache=True)
+    def _valid_nonce(prefix, nonce, difficulty, buf, state, w):
+        """Check whether sha256(prefix + str(nonce)) has `difficulty` leading zero nibbles."""
+        plen = prefix.shape[0]
+        buf[:plen] = prefix
+
+        # Base-10 integer to ASCII, written right after the prefix
+        digits = 1
+        tmp = nonce
+        while tmp >= 10:
+            tmp //= 10
+            digits += 1
+        tmp = nonce
+        for i in range(plen + digits - 1, plen - 1, -1):
+            buf[i] = 48 + tmp % 10
+            tmp //= 10
+
+        # SHA-256 padding
+        length = plen + digits
+        blocks = (length + 9 + 63) // 64
+        buf[length] = 0x80
+        buf[length + 1:blocks * 64] = 0
+        bits = length * 8
+        for i in range(8):
+            buf[blocks * 64 - 1 - i] = (bits >> (8 * i)) & 0xFF
+
+        state[:] = _IV
+        for block in range(blocks):
+            _compress(state, buf, block * 64, w)
+
+        word = 0
+        nibbles = difficulty
+        while nibbles >= 8:
+            if state[word] != 0:
+                return False
+            word += 1
+            nibbles -= 8
+        return nibbles == 0 or (state[word] >> (32 - 4 * nibbles)) == 0
+
+    @njit(cache=True, parallel=True)
+    def _search_round(prefix, difficulty, base, chunks):
+        """Scan `chunks` consecutive chunks from `base`; return the smallest hit or _NO_HIT."""
+        hits = np.full(chunks, _NO_HIT, dtype=np.int64)
+        # Best hit seen so far by any task. Reads and writes race, but every
+        # value stored is a real hit, so it is only used to stop chunks that
+        # can no longer produce the smallest nonce.
+        found = np.full(1, _NO_HIT, dtype=np.int64)
+        buf_len = ((prefix.shape[0] + 20 + 9 + 63) // 64) * 64
+
+        for chunk in prange(chunks):
+            buf = np.zeros(buf_len, dtype=np.uint8)
+            state = np.empty(8, dtype=np.int64)
+            w = np.empty(64, dtype=np.int64)
+            start = base + chunk * CHUNK_SIZE
+            for nonce in range(start, start + CHUNK_SIZE):
+                if nonce > found[0]:
+                    break
+                if _valid_nonce(prefix, nonce, difficulty, buf, state, w):
+                    hits[chunk] = nonce
+                    if nonce < found[0]:
+                        found[0] = nonce
+                    break
+
+        return hits.min()
+
+
+def search(last_proof: int, difficulty: int) -> int:
+    """
+    Find the smallest proof such that hash(last_proof, proof) has
+    `difficulty` leading zero hex digits, using all Numba threads.
+
+    Args:
+        last_proof: Previous proof
+        difficulty: Number of leading zero hex digits required
+
+    Returns:
+        New proof value
+    """
+    prefix = np.frombuffer(str(last_proof).encode(), dtype=np.uint8)
+    chunks = numba.get_num_threads() * CHUNKS_PER_THREAD
+    base = 0
+
+    while True:
+        found = _search_round(prefix, difficulty, base, chunks)
+        if found != _NO_HIT:
+            return int(found)
+        base += chunks * CHUNK_SIZE
@@ -7,15 +7,49 @@ functionality through a RESTful API and a web interface for visualization.
 
 import os
 import logging
-from flask import Flask, jsonify, request, render_template, redirect, url_for
-from blockchain import Blockchain
+import math
+from datetime import datetime
+from typing import Any, Dict
+from flask import Flask, Response, jsonify, request, render_template, redirect, url_for
+from flask.json.provider import DefaultJSONProvider
+import orjson
+from blockchain import CHAIN_FORMAT_VERSION, Blockchain
 
 # Configure logging
 logging.basicConfig(level=logging.DEBUG)
 logger = logging.getLogger(__name__)
 
+class OrjsonProvider(DefaultJSONProvider):
+    """
+    JSON provider that serializes with orjson.
+    
+    Keeps the default provider's key sorting and fallback conversions, but
+    encodes in native code and builds responses straight from bytes.
+    """
+    
+    def _options(self, sort_keys: bool) -> int:
+        option = orjson.OPT_NON_STR_KEYS
+        if sort_keys:
+            option |= orjson.OPT_SORT_KEYS
+        if (self.compact is None and self._app.debug) or self.compact is False:
+            option |= orjson.OPT_INDENT_2
+        return option
+    
+    def dumps(self, obj: Any, **kwargs: Any) -> str:
+        """Serialize data as JSON to a string."""
+        option = self._options(kwargs.get('sort_keys', self.sort_keys))
+        return orjson.dumps(obj, default=self.default, option=option).decode()
+    
+    def response(self, *args: Any, **kwargs: Any) -> Response:
+        """Serialize the given arguments as a JSON response."""
+        obj = self._prepare_response_obj(args, kwargs)
+        option = self._options(self.sort_keys) | orjson.OPT_APPEND_NEWLINE
+        return self._app.response_class(orjson.dumps(obj, default=self.default, option=option),
+                                        mimetype=self.mimetype)
+
 # Create the Flask application
 app = Flask(__name__)
+app.json = OrjsonProvider(app)
 app.secret_key = os.environ.get("SESSION_SECRET", "blockchain-secret-key")
 
 # Generate a unique node identifier
@@ -24,11 +58,39 @@ node_identifier = os.environ.get("NODE_ID", "node1")
 # Create an instance of the Blockchain
 blockchain = Blockchain(difficulty=4)
 
+def _valid_amount(amount) -> bool:
+    """Check that an amount is a finite number that fits in a JSON response."""
+    if isinstance(amount, bool) or not isinstance(amount, (int, float)):
+        return False
+    if isinstance(amount, int):
+        # orjson only encodes integers within 64 bits
+        return -2 ** 63 <= amount < 2 ** 64
+    return math.isfinite(amount)
+
+@app.template_filter('iso_timestamp')
+def _iso_timestamp(timestamp) -> str:
+    """Format a nanosecond timestamp as a local ISO 8601 string."""
+    if isinstance(timestamp, int):
+        return datetime.fromtimestamp(timestamp / 1e9).isoformat()
+    return str(timestamp)
+
+def _render_block(block: Dict) -> Dict:
+    """
+    Prepare a block for display.
+    
+    Args:
+        block: Block from the chain
+    
+    Returns:
+        A copy of the block with an added human-readable 'timestamp_iso'
+    """
+    return {**block, 'timestamp_iso': _iso_timestamp(block['timestamp'])}
+
 @app.route('/')
 def index():
     """Render the blockchain explorer interface."""
     return render_template('index.html', 
-                          chain=blockchain.chain, 
+                          chain=[_render_block(block) for block in blockchain.chain], 
                           transactions=blockchain.current_transactions,
                           node_id=node_identifier,
                           node_count=len(blockchain.nodes),
@@ -43,12 +105,15 @@ def mine():
         JSON response with the new block information
     """
     # Mine a new block
-    block = blockchain.mine_block()
+    block = _render_block(blockchain.mine_block())
     
     response = {
         'message': 'New block mined',
         'index': block['index'],
+        'timestamp': block['timestamp'],
+        'timestamp_iso': block['timestamp_iso'],
         'transactions': block['transactions'],
+        'merkle_root': block['merkle_root'],
         'proof': block['proof'],
         'previous_hash': block['previous_hash'],
     }
@@ -73,13 +138,19 @@ def new_transaction():
     required = ['sender', 'recipient', 'amount']
     if not all(k in values for k in required):
         return jsonify({'message': 'Missing values'}), 400
+    if not _valid_amount(values['amount']):
+        return jsonify({'message': 'Invalid amount'}), 400
     
     # Create a new transaction
-    index = blockchain.add_transaction(
-        sender=values['sender'],
-        recipient=values['recipient'],
-        amount=values['amount']
-    )
+    try:
+        index = blockchain.add_transaction(
+            sender=values['sender'],
+            recipient=values['recipient'],
+            amount=values['amount']
+        )
+    except ValueError as e:
+        # The pending transaction pool is full until the next block is mined
+        return jsonify({'message': str(e)}), 503
     
     response = {'message': f'Transaction will be added to Block {index}'}
     return jsonify(response), 201
@@ -92,11 +163,24 @@ def full_chain():
     Returns:
         JSON response with the complete chain and its length
     """
-    response = {
-        'chain': blockchain.chain,
-        'length': len(blockchain.chain),
-    }
-    return jsonify(response), 200
+    chain, etag = blockchain.chain_snapshot()
+    
+    # Let peers skip re-downloading a chain they already have, without
+    # rendering and serializing it first
+    if etag in request.if_none_match:
+        response = app.response_class(status=304)
+        response.set_etag(etag)
+        return response
+    
+    # Send blocks as stored: derived display fields like timestamp_iso are
+    # local to this node and must not reach peers' chains
+    response = jsonify({
+        'chain': chain,
+        'length': len(chain),
+        'version': CHAIN_FORMAT_VERSION,
+    })
+    response.set_etag(etag)
+    return response
 
 @app.route('/nodes/register', methods=['POST'])
 def register_nodes():
@@ -156,11 +240,14 @@ def validate_chain():
     Returns:
         JSON response with the validation result
     """
-    is_valid = blockchain.is_valid_chain(blockchain.chain)
+    # Validate a snapshot, re-hashing every block rather than trusting
+    # the cached hashes, so tampered blocks are detected
+    chain = list(blockchain.chain)
+    is_valid = blockchain.is_valid_chain(chain)
     
     response = {
         'valid': is_valid,
-        'chain': blockchain.chain
+        'chain': chain
     }
     
     if request.method == 'POST':
@@ -184,9 +271,11 @@ def create_transaction_web():
     if sender and recipient and amount:
         try:
             amount = float(amount)
+            if not _valid_amount(amount):
+                raise ValueError('amount must be finite')
             blockchain.add_transaction(sender, recipient, amount)
-        except ValueError:
-            logger.error(f"Invalid amount: {amount}")
+        except ValueError as e:
+            logger.error(f"Invalid transaction with amount {amount}: {e}")
     
     return redirect(url_for('index'))
 
@@ -209,4 +298,4 @@ def register_node_web():
     return redirect(url_for('index'))
 
 if __name__ == '__main__':
-    app.run(host='0.0.0.0', port=5000, debug=True)
+    app.run(host='0.0.0.0', port=5000, threaded=True)
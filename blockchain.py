@@ -8,15 +8,27 @@ management for consensus.
 Designed to be extendable and integrable with web frameworks like Flask or FastAPI.
 """
 
+import asyncio
+import functools
 import hashlib
-import json
 import logging
+import threading
 import time
-from datetime import datetime
-from typing import Dict, List, Optional, Set, Union
-import requests
+from typing import Callable, Dict, List, Optional, Set, Tuple, Union
+import httpx
+import orjson
 from urllib.parse import urlparse
 
+try:
+    import uvloop
+except ImportError:
+    uvloop = None
+
+import _pow_native
+import _pow_numba
+from bloom import BloomFilter
+from transactions import MAX_MEMPOOL, Transactions
+
 # Configure logging
 logging.basicConfig(
     level=logging.DEBUG,
@@ -24,6 +36,192 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+# Version of the block hashing format. Blocks are hashed over their header
+# fields, each fed to SHA-256 with a type tag and a length prefix, and commit
+# to their transactions through a Merkle root with domain-separated leaf and
+# inner node hashes, where an unpaired node is carried up a level unchanged.
+# Timestamps are integer nanoseconds since the epoch. Nodes only exchange
+# chains of the same version.
+CHAIN_FORMAT_VERSION = 6
+
+# Block fields covered by the block hash, in hashing order
+HEADER_FIELDS = ('index', 'timestamp', 'merkle_root', 'proof', 'previous_hash')
+
+# Fields of a block: its header and the transactions the header commits to
+BLOCK_FIELDS = ('index', 'timestamp', 'transactions', 'merkle_root', 'proof', 'previous_hash')
+
+# Transaction fields hashed individually into a Merkle leaf, in hashing order;
+# any other transaction data is hashed as one canonical JSON object after them
+TRANSACTION_FIELDS = ('sender', 'recipient', 'amount', 'timestamp')
+
+# Placeholder hashed for a field that is absent, to tell it apart from None
+_MISSING = object()
+
+# Domain separators for Merkle leaf and inner node hashes, so a leaf can
+# never be passed off as an inner node or the reverse
+MERKLE_LEAF_PREFIX = b'\x00'
+MERKLE_NODE_PREFIX = b'\x01'
+
+# Merkle root of a block without transactions
+EMPTY_MERKLE_ROOT = hashlib.sha256(b'').hexdigest()
+
+# Seconds to wait for a peer's /chain response
+PEER_TIMEOUT = 2
+
+# Maximum number of open connections to peers during consensus
+MAX_PEER_CONNECTIONS = 100
+
+# Number of (last_proof, proof, difficulty) checks remembered across validations
+PROOF_CACHE_SIZE = 65536
+
+def canonical_json(obj) -> bytes:
+    """
+    Serialize an object to canonical JSON bytes for hashing.
+    
+    Always uses orjson (sorted keys, no whitespace, UTF-8): other encoders
+    format floats and NaN differently, and the bytes must match across nodes.
+    
+    Args:
+        obj: JSON-serializable object
+    
+    Returns:
+        The canonical encoding
+    
+    Raises:
+        TypeError: If obj cannot be encoded, e.g. an integer beyond 64 bits
+    """
+    return orjson.dumps(obj, option=orjson.OPT_SORT_KEYS)
+
+@functools.lru_cache(maxsize=None)
+def _proof_checker(difficulty: int) -> Callable[[bytes], bool]:
+    """
+    Build a digest check specialized for a difficulty.
+    
+    The number of leading zero bytes, and the bound on the byte holding an
+    odd trailing zero nibble, are generated into the function's source as
+    constants, so a check is one bytes compare and at most one integer compare.
+    
+    Args:
+        difficulty: Number of leading zero hex digits required
+    
+    Returns:
+        A function taking a raw SHA-256 digest and returning True if it
+        satisfies the difficulty
+    """
+    zero_bytes, odd_nibble = divmod(difficulty, 2)
+    conditions = []
+    if zero_bytes:
+        conditions.append(f'digest[:{zero_bytes}] == {bytes(zero_bytes)!r}')
+    if odd_nibble:
+        conditions.append(f'digest[{zero_bytes}] < 16')
+    
+    source = f"def check(digest):\n    return {' and '.join(conditions) or 'True'}\n"
+    namespace = {}
+    exec(compile(source, f'<proof checker difficulty={difficulty}>', 'exec'), namespace)
+    return namespace['check']
+
+@functools.lru_cache(maxsize=PROOF_CACHE_SIZE)
+def _valid_proof_cached(last_proof: int, proof: int, difficulty: int) -> bool:
+    """
+    Check a proof, remembering the result.
+    
+    Consensus revalidates the same blocks every round, so shared prefixes
+    of peer chains are answered from the cache instead of re-hashed.
+    """
+    guess = f'{last_proof}{proof}'.encode()
+    return _proof_checker(difficulty)(hashlib.sha256(guess).digest())
+
+def _update_field(h, value) -> None:
+    """
+    Feed one field into a hash as a type tag, its 4-byte big-endian length
+    and its bytes.
+    
+    The tag keeps equal-looking values of different types apart (5 and '5',
+    None and 'None', a missing field and None), and the length prefix keeps
+    field boundaries unambiguous without escaping.
+    
+    Args:
+        h: hashlib hash object to update
+        value: Field value; lists and dictionaries are hashed as canonical JSON
+    """
+    if value is _MISSING:
+        tag, data = b'-', b''
+    elif value is None:
+        tag, data = b'n', b''
+    elif isinstance(value, bool):
+        tag, data = b'b', b'1' if value else b'0'
+    elif isinstance(value, int):
+        tag, data = b'i', str(value).encode()
+    elif isinstance(value, float):
+        tag, data = b'f', repr(value).encode()
+    elif isinstance(value, str):
+        tag, data = b's', value.encode()
+    else:
+        tag, data = b'j', canonical_json(value)
+    h.update(tag)
+    h.update(len(data).to_bytes(4, 'big'))
+    h.update(data)
+
+def transaction_hash(transaction: Dict) -> bytes:
+    """
+    Create the Merkle leaf hash of a transaction.
+    
+    Args:
+        transaction: Transaction to hash
+    
+    Returns:
+        SHA-256 digest of the transaction's fields
+    """
+    h = hashlib.sha256(MERKLE_LEAF_PREFIX)
+    for field in TRANSACTION_FIELDS:
+        _update_field(h, transaction.get(field, _MISSING))
+    extra = {key: value for key, value in transaction.items() if key not in TRANSACTION_FIELDS}
+    _update_field(h, extra)
+    return h.digest()
+
+def merkle_root(leaves: List[bytes]) -> str:
+    """
+    Compute the Merkle root over a list of leaf hashes.
+    
+    On levels with an odd number of nodes the last node is carried up
+    unchanged. Pairing it with itself would give [a, b, c] and [a, b, c, c]
+    the same root (CVE-2012-2459).
+    
+    Args:
+        leaves: Leaf digests, in transaction order
+    
+    Returns:
+        The root as a hex string
+    """
+    if not leaves:
+        return EMPTY_MERKLE_ROOT
+    
+    level = leaves
+    while len(level) > 1:
+        parents = [hashlib.sha256(MERKLE_NODE_PREFIX + level[i] + level[i + 1]).digest()
+                   for i in range(0, len(level) - 1, 2)]
+        if len(level) % 2:
+            parents.append(level[-1])
+        level = parents
+    return level[0].hex()
+
+def _run_async(coro):
+    """
+    Run a coroutine to completion on a new event loop.
+    
+    Uses uvloop's event loop when it is installed.
+    
+    Args:
+        coro: Coroutine to run
+    
+    Returns:
+        The coroutine's result
+    """
+    if uvloop is not None:
+        with asyncio.Runner(loop_factory=uvloop.new_event_loop) as runner:
+            return runner.run(coro)
+    return asyncio.run(coro)
+
 class Blockchain:
     """
     Blockchain class implementing core blockchain functionalities.
@@ -42,12 +240,30 @@ class Blockchain:
         """
         # Initialize the chain with the genesis block
         self.chain = []
+        # Hash of each block in the chain, kept alongside it (not inside the
+        # block, which would change the hashes themselves)
+        self._hashes = []
         # Pending transactions to be included in the next block
-        self.current_transactions = []
+        self.current_transactions = Transactions(MAX_MEMPOOL)
+        # Merkle leaves of the pending transactions, and their root once computed
+        self._pending_merkle_leaves: List[bytes] = []
+        self._pending_merkle_root: Optional[str] = None
+        # Keys of the pending transactions, to reject resubmitted duplicates
+        self._tx_bloom = BloomFilter(MAX_MEMPOOL)
         # Set of nodes in the network
         self.nodes = set()
         # Difficulty level for proof of work
         self.difficulty = difficulty
+        # Digest check specialized for this difficulty
+        self._check_digest = _proof_checker(difficulty)
+        # Guards chain, current_transactions and nodes, which are shared
+        # between the server's request threads
+        self._lock = threading.RLock()
+        # Last /chain response seen from each node: (etag, chain, candidate),
+        # where candidate is the validated chain to adopt and its hashes, or
+        # None if the chain has not been validated or is invalid
+        self._peer_chain_cache: Dict[str, Tuple[Optional[str], List[Dict],
+                                                Optional[Tuple[List[Dict], List[str]]]]] = {}
         
         # Create the genesis block
         logger.info("Creating genesis block")
@@ -64,24 +280,29 @@ class Blockchain:
         Returns:
             The newly created block as a dictionary
         """
-        # If previous_hash is not provided, use the hash of the last block
-        if previous_hash is None and self.chain:
-            previous_hash = self.hash(self.chain[-1])
-        
-        # Define the block structure
-        block = {
-            'index': len(self.chain) + 1,
-            'timestamp': datetime.now().isoformat(),
-            'transactions': self.current_transactions.copy(),
-            'proof': proof,
-            'previous_hash': previous_hash
-        }
-        
-        # Reset the current list of transactions
-        self.current_transactions = []
-        
-        # Add the block to the chain
-        self.chain.append(block)
+        with self._lock:
+            # If previous_hash is not provided, use the hash of the last block
+            if previous_hash is None and self.chain:
+                previous_hash = self._hashes[-1]
+            
+            # Define the block structure
+            block = {
+                'index': len(self.chain) + 1,
+                'timestamp': time.time_ns(),
+                'transactions': self.current_transactions.drain(),
+                'merkle_root': self.pending_merkle_root,
+                'proof': proof,
+                'previous_hash': previous_hash
+            }
+            
+            # Reset the pending transaction state
+            self._pending_merkle_leaves = []
+            self._pending_merkle_root = None
+            self._tx_bloom.clear()
+            
+            # Add the block to the chain
+            self.chain.append(block)
+            self._hashes.append(self.hash(block))
         logger.info(f"Created block #{block['index']} with {len(block['transactions'])} transactions")
         
         return block
@@ -90,6 +311,10 @@ class Blockchain:
         """
         Add a new transaction to the list of transactions.
         
+        A transaction identical to one that is already pending (same sender,
+        recipient, amount and additional data) is ignored, so a client
+        retrying a request does not submit it twice.
+        
         Args:
             sender: Address of the sender
             recipient: Address of the recipient
@@ -98,23 +323,38 @@ class Blockchain:
         
         Returns:
             The index of the block that will contain this transaction
+        
+        Raises:
+            ValueError: If the pending transaction pool is full
         """
-        # Create the transaction structure
-        transaction = {
-            'sender': sender,
-            'recipient': recipient,
-            'amount': amount,
-            'timestamp': datetime.now().isoformat(),
-            **kwargs  # Include any additional transaction data
-        }
-        
-        # Add the transaction to the list
-        self.current_transactions.append(transaction)
-        logger.debug(f"Added transaction: {sender} -> {recipient}: {amount}")
+        timestamp = time.time_ns()
+        # Dedup key, encoded like a Merkle leaf (without the timestamp)
+        h = hashlib.sha256()
+        for value in (sender, recipient, amount):
+            _update_field(h, value)
+        _update_field(h, kwargs)
+        key = h.digest()[:16]
+        
+        with self._lock:
+            # Index of the block that will contain this transaction
+            # (the next one to be mined)
+            index = self.last_block['index'] + 1
+            
+            # The filter rules out almost every new transaction without a
+            # scan; only a hit is confirmed against the pool
+            if key in self._tx_bloom and self.current_transactions.contains(
+                    sender, recipient, amount, kwargs):
+                logger.info(f"Ignoring duplicate transaction: {sender} -> {recipient}: {amount}")
+                return index
+            
+            # Add the transaction to the pool (raises if the pool is full)
+            self.current_transactions.append(sender, recipient, amount, timestamp, kwargs)
+            self._tx_bloom.add(key)
+            self._pending_merkle_leaves.append(transaction_hash(self.current_transactions[-1]))
+            self._pending_merkle_root = None
         
-        # Return the index of the block that will contain this transaction
-        # (the next one to be mined)
-        return self.last_block['index'] + 1
+        logger.debug(f"Added transaction: {sender} -> {recipient}: {amount}")
+        return index
     
     @property
     def last_block(self) -> Dict:
@@ -126,10 +366,49 @@ class Blockchain:
         """
         return self.chain[-1]
     
+    @property
+    def pending_merkle_root(self) -> str:
+        """
+        Return the Merkle root of the pending transactions.
+        
+        Returns:
+            The root as a hex string, computed once per change to the pool
+        """
+        with self._lock:
+            if self._pending_merkle_root is None:
+                self._pending_merkle_root = merkle_root(self._pending_merkle_leaves)
+            return self._pending_merkle_root
+    
+    @property
+    def etag(self) -> str:
+        """
+        Return a tag identifying the current chain for HTTP caching.
+        
+        Returns:
+            Tag built from the chain format version, length and last block hash
+        """
+        with self._lock:
+            return f'{CHAIN_FORMAT_VERSION}-{len(self.chain)}-{self._hashes[-1]}'
+    
+    def chain_snapshot(self) -> Tuple[List[Dict], str]:
+        """
+        Return a copy of the chain together with its ETag.
+        
+        Returns:
+            The chain and its tag, read under one lock so they always match
+        """
+        with self._lock:
+            return list(self.chain), self.etag
+    
     @staticmethod
     def hash(block: Dict) -> str:
         """
-        Create a SHA-256 hash of a block.
+        Create a SHA-256 hash of a block header.
+        
+        Transactions are covered through the header's merkle_root, so the
+        cost does not grow with the number of transactions in the block.
+        The header fields are fed to SHA-256 one by one rather than
+        serialized into an intermediate JSON document.
         
         Args:
             block: Block to hash
@@ -137,9 +416,10 @@ class Blockchain:
         Returns:
             Hash of the block as a string
         """
-        # Ensure the dictionary is ordered to get consistent hashes
-        block_string = json.dumps(block, sort_keys=True).encode()
-        return hashlib.sha256(block_string).hexdigest()
+        h = hashlib.sha256()
+        for field in HEADER_FIELDS:
+            _update_field(h, block.get(field, _MISSING))
+        return h.hexdigest()
     
     def proof_of_work(self, last_proof: int) -> int:
         """
@@ -153,14 +433,43 @@ class Blockchain:
         Returns:
             New proof value
         """
-        proof = 0
-        target = '0' * self.difficulty
-        
         logger.debug(f"Starting proof of work with difficulty {self.difficulty}")
         start_time = time.time()
         
-        while self.valid_proof(last_proof, proof) is False:
-            proof += 1
+        if _pow_native.available:
+            # Scan nonces in the compiled SHA-256 kernel
+            proof = _pow_native.find_nonce(last_proof, self.difficulty)
+        elif _pow_numba.available:
+            # Search nonce stripes on all cores with the Numba kernel
+            proof = _pow_numba.search(last_proof, self.difficulty)
+        else:
+            # last_proof is fixed for the whole search, so hash it once and
+            # only feed each candidate nonce into a copy of that context
+            base = hashlib.sha256(str(last_proof).encode())
+            check_digest = self._check_digest
+            # The nonce's ASCII digits live in a reused buffer: most steps
+            # only bump the last digit in place, and the digits are only
+            # re-rendered when that digit carries
+            digits = bytearray(20)
+            digits[0] = ord('0')
+            view = memoryview(digits)
+            nonce = view[:1]
+            last = 0
+            nine = ord('9')
+            proof = 0
+            while True:
+                candidate = base.copy()
+                candidate.update(nonce)
+                if check_digest(candidate.digest()):
+                    break
+                proof += 1
+                if digits[last] != nine:
+                    digits[last] += 1
+                else:
+                    rendered = str(proof).encode()
+                    digits[:len(rendered)] = rendered
+                    last = len(rendered) - 1
+                    nonce = view[:len(rendered)]
         
         duration = time.time() - start_time
         logger.info(f"Found proof {proof} in {duration:.2f} seconds")
@@ -178,16 +487,20 @@ class Blockchain:
         Returns:
             True if correct, False if not
         """
-        guess = f'{last_proof}{proof}'.encode()
-        guess_hash = hashlib.sha256(guess).hexdigest()
-        return guess_hash[:self.difficulty] == '0' * self.difficulty
+        # The cache is keyed on the values, so only accept ints: 1, 1.0 and
+        # True compare equal but hash different strings
+        if type(last_proof) is not int or type(proof) is not int:
+            return False
+        return _valid_proof_cached(last_proof, proof, self.difficulty)
     
-    def is_valid_chain(self, chain: List[Dict]) -> bool:
+    def is_valid_chain(self, chain: List[Dict], hashes: Optional[List[str]] = None) -> bool:
         """
         Determine if a given blockchain is valid.
         
         Args:
             chain: A blockchain
+            hashes: Hashes of the chain's blocks, trusted as given (optional,
+                    recomputed from the blocks if not provided)
             
         Returns:
             True if valid, False if not
@@ -198,28 +511,137 @@ class Blockchain:
             
         # Check if the chain has a valid genesis block
         if (chain[0]['previous_hash'] != '0' or
-            chain[0]['proof'] != 1):
+            chain[0]['proof'] != 1 or
+            not self._check_merkle_root(chain[0])):
             logger.error("Invalid genesis block")
             return False
         
         # Check the integrity of the chain
-        for i in range(1, len(chain)):
-            block = chain[i]
-            prev_block = chain[i - 1]
-            
-            # Check that the hash of the previous block is correct
-            if block['previous_hash'] != self.hash(prev_block):
-                logger.error(f"Invalid hash at block {i}")
-                return False
-                
-            # Check that the Proof of Work is correct
-            if not self.valid_proof(prev_block['proof'], block['proof']):
-                logger.error(f"Invalid proof at block {i}")
-                return False
+        if not self._check_links(chain, 1, len(chain), hashes):
+            return False
                 
         logger.info("Chain validated successfully")
         return True
     
+    def _validate_suffix(self, chain: List[Dict], known_chain: List[Dict],
+                         known_hashes: List[str]) -> Optional[Tuple[int, List[str]]]:
+        """
+        Validate a blockchain, skipping the blocks it shares with a known
+        valid chain.
+        
+        The shared prefix is found by hash linkage alone and none of its
+        blocks are checked, so callers must keep their own copies of those
+        blocks rather than the ones in `chain`. The first block after the
+        prefix is checked against our copy of its predecessor for the same
+        reason.
+        
+        Args:
+            chain: A blockchain
+            known_chain: A known valid chain
+            known_hashes: Hashes of the blocks of known_chain
+            
+        Returns:
+            The length of the shared prefix and the hashes of all blocks of
+            `chain` (the prefix's taken from known_hashes), or None if the
+            chain is invalid
+        """
+        common = self._common_prefix_length(chain, known_hashes)
+        # Hash each block after the prefix once, for both checking and adoption
+        hashes = known_hashes[:common] + [self.hash(block) for block in chain[common:]]
+        if common == 0:
+            return (0, hashes) if self.is_valid_chain(chain, hashes) else None
+        
+        # Block `common` links to a block we already trust, so check its
+        # proof against our copy of that block, not the peer's unchecked one,
+        # then check everything after it
+        if not (self._check_pair(known_chain[common - 1], chain[common], known_hashes[common - 1]) and
+                self._check_links(chain, common + 1, len(chain), hashes)):
+            return None
+        
+        logger.info(f"Chain validated successfully from block {common + 1}")
+        return common, hashes
+    
+    @staticmethod
+    def _common_prefix_length(chain: List[Dict], known_hashes: List[str]) -> int:
+        """
+        Find how many leading blocks a chain shares with a known chain.
+        
+        Searches from the end, so a chain that extends the known one is
+        matched with a single comparison.
+        
+        Args:
+            chain: A blockchain
+            known_hashes: Hashes of the blocks of the known chain
+        
+        Returns:
+            The length of the shared prefix (0 if only the genesis differs)
+        """
+        for length in range(min(len(known_hashes), len(chain) - 1), 0, -1):
+            if chain[length].get('previous_hash') == known_hashes[length - 1]:
+                return length
+        return 0
+    
+    def _check_pair(self, prev_block: Dict, block: Dict, prev_hash: Optional[str] = None) -> bool:
+        """
+        Check that a block correctly follows its predecessor.
+        
+        Args:
+            prev_block: The preceding block
+            block: The block to check
+            prev_hash: Known hash of prev_block (optional, computed if not provided)
+        
+        Returns:
+            True if the link and proof are valid, False if not
+        """
+        if prev_hash is None:
+            prev_hash = self.hash(prev_block)
+        
+        # Check that the hash of the previous block is correct
+        if block['previous_hash'] != prev_hash:
+            logger.error(f"Invalid hash at block {block['index']}")
+            return False
+            
+        # Check that the Proof of Work is correct
+        if not self.valid_proof(prev_block['proof'], block['proof']):
+            logger.error(f"Invalid proof at block {block['index']}")
+            return False
+        
+        return self._check_merkle_root(block)
+    
+    @staticmethod
+    def _check_merkle_root(block: Dict) -> bool:
+        """
+        Check that a block's merkle_root commits to its transactions.
+        
+        Args:
+            block: The block to check
+        
+        Returns:
+            True if the root matches, False if not
+        """
+        leaves = [transaction_hash(transaction) for transaction in block['transactions']]
+        if block.get('merkle_root') != merkle_root(leaves):
+            logger.error(f"Invalid merkle root at block {block['index']}")
+            return False
+        return True
+    
+    def _check_links(self, chain: List[Dict], start: int, stop: int,
+                     hashes: Optional[List[str]] = None) -> bool:
+        """
+        Check the links of chain[start:stop] to their predecessors.
+        
+        Args:
+            chain: A blockchain
+            start: Position of the first block to check (at least 1)
+            stop: Position after the last block to check
+            hashes: Known hashes of the chain's blocks (optional)
+        
+        Returns:
+            True if every link is valid, False if not
+        """
+        return all(self._check_pair(chain[i - 1], chain[i], hashes[i - 1] if hashes else None)
+                   for i in range(start, stop))
+    
     def register_node(self, address: str) -> None:
         """
         Add a new node to the list of nodes.
@@ -229,15 +651,135 @@ class Blockchain:
         """
         parsed_url = urlparse(address)
         if parsed_url.netloc:
-            self.nodes.add(parsed_url.netloc)
+            node = parsed_url.netloc
         elif parsed_url.path:
             # Accept an URL without scheme like '192.168.0.5:5000'.
-            self.nodes.add(parsed_url.path)
+            node = parsed_url.path
         else:
             raise ValueError('Invalid URL')
         
+        with self._lock:
+            self.nodes.add(node)
+        
         logger.info(f"Registered node: {address}")
     
+    async def _fetch_chains(self, nodes: List[str]) -> List[Union[httpx.Response, BaseException]]:
+        """
+        Request the chains of several nodes concurrently.
+        
+        Args:
+            nodes: Addresses of the nodes (e.g., '192.168.0.5:5000')
+        
+        Returns:
+            The response, or the raised exception, for each node in order
+        """
+        limits = httpx.Limits(max_connections=MAX_PEER_CONNECTIONS)
+        async with httpx.AsyncClient(timeout=PEER_TIMEOUT, limits=limits) as client:
+            pending = []
+            for node in nodes:
+                cached = self._peer_chain_cache.get(node)
+                # Only download the chain again if it changed since the last round
+                headers = {'If-None-Match': cached[0]} if cached and cached[0] else {}
+                pending.append(client.get(f'http://{node}/chain', headers=headers))
+            return await asyncio.gather(*pending, return_exceptions=True)
+    
+    def _read_peer_chain(self, node: str, response: Union[httpx.Response, BaseException]
+                         ) -> Optional[Tuple[Optional[str], List[Dict],
+                                             Optional[Tuple[List[Dict], List[str]]]]]:
+        """
+        Turn a node's /chain response into a cache entry.
+        
+        Args:
+            node: Address of the node
+            response: The node's response, or the exception raised fetching it
+        
+        Returns:
+            (etag, chain, candidate) for the node, or None if it has no usable chain
+        """
+        # Any failure specific to this node (unreachable, invalid address)
+        # only drops it from the round; cancellation and exit still propagate
+        if isinstance(response, Exception):
+            logger.error(f"Error connecting to node {node}: {response!r}")
+            return None
+        if isinstance(response, BaseException):
+            raise response
+        
+        cached = self._peer_chain_cache.get(node)
+        if response.status_code == 304 and cached:
+            return cached
+        if response.status_code != 200:
+            return None
+        
+        try:
+            payload = orjson.loads(response.content)
+        except ValueError as e:
+            logger.error(f"Invalid chain response from node {node}: {e}")
+            return None
+        if not isinstance(payload, dict):
+            logger.error(f"Invalid chain response from node {node}: not an object")
+            return None
+        
+        # Blocks hashed with another format can never validate here
+        if payload.get('version') != CHAIN_FORMAT_VERSION:
+            logger.warning(f"Ignoring chain from node {node} with format "
+                           f"version {payload.get('version')}")
+            return None
+        
+        chain = payload.get('chain')
+        blocks = [self._normalize_block(block) for block in chain] if isinstance(chain, list) else None
+        if not blocks or any(block is None for block in blocks):
+            logger.error(f"Malformed chain from node {node}")
+            return None
+        
+        entry = (response.headers.get('ETag'), blocks, None)
+        if entry[0]:
+            self._peer_chain_cache[node] = entry
+        return entry
+    
+    @staticmethod
+    def _normalize_block(block) -> Optional[Dict]:
+        """
+        Rebuild a peer's block from the fields covered by its hash.
+        
+        Any other keys are dropped, since nothing validates them.
+        
+        Args:
+            block: Block as received from a peer
+        
+        Returns:
+            The rebuilt block, or None if it is missing fields or malformed
+        """
+        if not isinstance(block, dict) or not all(field in block for field in BLOCK_FIELDS):
+            return None
+        transactions = block['transactions']
+        if not isinstance(transactions, list) or not all(
+                isinstance(transaction, dict) for transaction in transactions):
+            return None
+        return {field: block[field] for field in BLOCK_FIELDS}
+    
+    def _validate_candidate(self, chain: List[Dict], known_chain: List[Dict],
+                            known_hashes: List[str]) -> Optional[Tuple[List[Dict], List[str]]]:
+        """
+        Validate a peer chain against a snapshot of ours.
+        
+        Args:
+            chain: The peer's chain
+            known_chain: Snapshot of our chain
+            known_hashes: Hashes of the blocks of known_chain
+        
+        Returns:
+            The chain to adopt and its block hashes, or None if the peer's
+            chain is invalid. Blocks shared with our chain are taken from
+            known_chain.
+        """
+        # Only validate the blocks after the prefix it shares with ours
+        result = self._validate_suffix(chain, known_chain, known_hashes)
+        if result is None:
+            return None
+        
+        common, hashes = result
+        return known_chain[:common] + chain[common:], hashes
+    
     def resolve_conflicts(self) -> bool:
         """
         Consensus Algorithm: Resolve conflicts by replacing our chain with
@@ -246,34 +788,43 @@ class Blockchain:
         Returns:
             True if our chain was replaced, False if not
         """
-        neighbors = self.nodes
-        new_chain = None
-        
+        with self._lock:
+            neighbors = list(self.nodes)
+            known_chain = list(self.chain)
+            known_hashes = list(self._hashes)
         # We're only looking for chains longer than ours
-        max_length = len(self.chain)
-        
-        # Grab and verify the chains from all nodes in our network
-        for node in neighbors:
-            try:
-                # Make a request to get the node's chain
-                response = requests.get(f'http://{node}/chain')
-                
-                if response.status_code == 200:
-                    length = response.json()['length']
-                    chain = response.json()['chain']
-                    
-                    # Check if the length is longer and the chain is valid
-                    if length > max_length and self.is_valid_chain(chain):
-                        max_length = length
-                        new_chain = chain
-            except requests.RequestException as e:
-                logger.error(f"Error connecting to node {node}: {e}")
+        max_length = len(known_chain)
+        new_chain = None
+        new_hashes = None
+        
+        # Grab the chains from all nodes in our network concurrently
+        responses = _run_async(self._fetch_chains(neighbors)) if neighbors else []
+        entries = []
+        for node, response in zip(neighbors, responses):
+            entry = self._read_peer_chain(node, response)
+            if entry is not None and len(entry[1]) > max_length:
+                entries.append((node, entry))
+        
+        # Verify the longest chains first; the first valid one wins
+        entries.sort(key=lambda item: len(item[1][1]), reverse=True)
+        for node, (etag, chain, candidate) in entries:
+            if candidate is None:
+                candidate = self._validate_candidate(chain, known_chain, known_hashes)
+                if etag:
+                    self._peer_chain_cache[node] = (etag, chain, candidate)
+            if candidate is not None:
+                new_chain, new_hashes = candidate
+                max_length = len(new_chain)
+                break
         
         # Replace our chain if we found a longer valid one
-        if new_chain:
-            self.chain = new_chain
-            logger.info(f"Chain replaced with a longer one of length {max_length}")
-            return True
+        with self._lock:
+            # Another thread may have extended our chain while we were fetching
+            if new_chain and len(new_chain) > len(self.chain):
+                self.chain = new_chain
+                self._hashes = new_hashes
+                logger.info(f"Chain replaced with a longer one of length {max_length}")
+                return True
             
         logger.info("Our chain is authoritative")
         return False
@@ -285,15 +836,19 @@ class Blockchain:
         Returns:
             The newly mined block
         """
-        # Get the last block's proof
-        last_block = self.last_block
-        last_proof = last_block['proof']
-        
-        # Run the proof of work algorithm to get the next proof
-        proof = self.proof_of_work(last_proof)
-        
-        # Create a new block and add it to the chain
-        previous_hash = self.hash(last_block)
-        block = self.create_block(proof, previous_hash)
-        
-        return block
+        while True:
+            # Get the last block's proof
+            last_block = self.last_block
+            last_proof = last_block['proof']
+            
+            # Run the proof of work algorithm to get the next proof
+            # (outside the lock so transactions can still be added)
+            proof = self.proof_of_work(last_proof)
+            
+            with self._lock:
+                # Only link the block if the chain did not move on meanwhile
+                if self.last_block is last_block:
+                    # Create a new block and add it to the chain
+                    return self.create_block(proof, self._hashes[-1])
+            
+            logger.info("Chain changed while mining, restarting proof of work")
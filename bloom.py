@@ -0,0 +1,57 @@
+"""
+Bloom Filter Module
+
+This module provides a small Bloom filter for fast, probabilistic membership
+checks. A negative answer is always correct; a positive answer may be a false
+positive at roughly the configured error rate.
+"""
+
+import math
+
+
+class BloomFilter:
+    """
+    Bloom filter over byte-string keys backed by a bytearray.
+
+    Keys are expected to already be uniformly distributed (for example a
+    SHA-256 digest), so bit positions are derived from the key itself by
+    double hashing instead of running additional hash functions.
+    """
+
+    def __init__(self, capacity: int, error_rate: float = 0.001):
+        """
+        Initialize an empty Bloom filter.
+
+        Args:
+            capacity: Number of keys the filter is sized for
+            error_rate: Target false positive rate at capacity (default: 0.001)
+        """
+        # Optimal number of bits and hash functions for the requested rate
+        self.size = max(8, math.ceil(-capacity * math.log(error_rate) / math.log(2) ** 2))
+        self.hash_count = max(1, round(self.size / capacity * math.log(2)))
+        self._bits = bytearray((self.size + 7) // 8)
+
+    def _positions(self, key: bytes):
+        """Yield the bit positions for a key (at least 16 bytes long)."""
+        h1 = int.from_bytes(key[:8], 'big')
+        h2 = int.from_bytes(key[8:16], 'big') | 1
+        for i in range(self.hash_count):
+            yield (h1 + i * h2) % self.size
+
+    def add(self, key: bytes) -> None:
+        """
+        Add a key to the filter.
+
+        Args:
+            key: Key to add
+        """
+        for position in self._positions(key):
+            self._bits[position >> 3] |= 1 << (position & 7)
+
+    def __contains__(self, key: bytes) -> bool:
+        return all(self._bits[position >> 3] & (1 << (position & 7))
+                   for position in self._positions(key))
+
+    def clear(self) -> None:
+        """Remove all keys from the filter."""
+        self._bits = bytearray(len(self._bits))
@@ -1,10 +1,11 @@
 """
 Main entry point for the Blockchain API Application.
 
-This file serves as the entry point for running the Flask application.
+This file serves as the entry point for running the Flask application with
+the development server. For production use wsgi.py with Gunicorn.
 """
 
 from app import app
 
 if __name__ == '__main__':
-    app.run(host='0.0.0.0', port=5000, debug=True)
+    app.run(host='0.0.0.0', port=5000, threaded=True)
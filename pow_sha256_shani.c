@@ -0,0 +1,247 @@
+/*
+ * Native Proof of Work Scanner
+ *
+ * Searches for the first nonce n in [start, start + count) such that
+ * SHA-256(prefix || decimal(n)) starts with `zero_nibbles` zero hex digits,
+ * which is exactly the check performed by Blockchain.valid_proof.
+ *
+ * The SHA-256 state over the full 64-byte blocks of the prefix (the midstate)
+ * is computed once per call; each candidate only compresses the tail block(s)
+ * holding the nonce digits. Compression uses the x86 SHA extensions when the
+ * CPU supports them and a portable scalar implementation otherwise.
+ *
+ * Build:
+ *     cc -O3 -shared -fPIC -o pow_sha256_shani.so pow_sha256_shani.c
+ *
+ * Define POW_FORCE_SCALAR (-DPOW_FORCE_SCALAR) to always use the scalar path.
+ */
+
+#include <stddef.h>
+#include <stdint.h>
+#include <string.h>
+
+#if defined(__x86_64__) || defined(__i386__)
+#define POW_HAVE_X86 1
+#include <cpuid.h>
+#include <immintrin.h>
+#endif
+
+#define POW_NOT_FOUND UINT64_MAX
+
+typedef void (*compress_fn)(uint32_t state[8], const uint8_t *data, size_t blocks);
+
+static const uint32_t SHA256_IV[8] = {
+    0x6a09e667, 0xbb67ae85, 0x3c6ef372, 0xa54ff53a,
+    0x510e527f, 0x9b05688c, 0x1f83d9ab, 0x5be0cd19,
+};
+
+static const uint32_t SHA256_K[64] = {
+    0x428a2f98, 0x71374491, 0xb5c0fbcf, 0xe9b5dba5, 0x3956c25b, 0x59f111f1, 0x923f82a4, 0xab1c5ed5,
+    0xd807aa98, 0x12835b01, 0x243185be, 0x550c7dc3, 0x72be5d74, 0x80deb1fe, 0x9bdc06a7, 0xc19bf174,
+    0xe49b69c1, 0xefbe4786, 0x0fc19dc6, 0x240ca1cc, 0x2de92c6f, 0x4a7484aa, 0x5cb0a9dc, 0x76f988da,
+    0x983e5152, 0xa831c66d, 0xb00327c8, 0xbf597fc7, 0xc6e00bf3, 0xd5a79147, 0x06ca6351, 0x14292967,
+    0x27b70a85, 0x2e1b2138, 0x4d2c6dfc, 0x53380d13, 0x650a7354, 0x766a0abb, 0x81c2c92e, 0x92722c85,
+    0xa2bfe8a1, 0xa81a664b, 0xc24b8b70, 0xc76c51a3, 0xd192e819, 0xd6990624, 0xf40e3585, 0x106aa070,
+    0x19a4c116, 0x1e376c08, 0x2748774c, 0x34b0bcb5, 0x391c0cb3, 0x4ed8aa4a, 0x5b9cca4f, 0x682e6ff3,
+    0x748f82ee, 0x78a5636f, 0x84c87814, 0x8cc70208, 0x90befffa, 0xa4506ceb, 0xbef9a3f7, 0xc67178f2,
+};
+
+#define ROTR(x, n) (((x) >> (n)) | ((x) << (32 - (n))))
+
+static void compress_scalar(uint32_t state[8], const uint8_t *data, size_t blocks)
+{
+    uint32_t w[64];
+
+    while (blocks--) {
+        uint32_t a = state[0], b = state[1], c = state[2], d = state[3];
+        uint32_t e = state[4], f = state[5], g = state[6], h = state[7];
+        int i;
+
+        for (i = 0; i < 16; i++) {
+            w[i] = ((uint32_t)data[4 * i] << 24) | ((uint32_t)data[4 * i + 1] << 16) |
+                   ((uint32_t)data[4 * i + 2] << 8) | (uint32_t)data[4 * i + 3];
+        }
+        for (i = 16; i < 64; i++) {
+            uint32_t s0 = ROTR(w[i - 15], 7) ^ ROTR(w[i - 15], 18) ^ (w[i - 15] >> 3);
+            uint32_t s1 = ROTR(w[i - 2], 17) ^ ROTR(w[i - 2], 19) ^ (w[i - 2] >> 10);
+            w[i] = w[i - 16] + s0 + w[i - 7] + s1;
+        }
+        for (i = 0; i < 64; i++) {
+            uint32_t s1 = ROTR(e, 6) ^ ROTR(e, 11) ^ ROTR(e, 25);
+            uint32_t ch = (e & f) ^ (~e & g);
+            uint32_t t1 = h + s1 + ch + SHA256_K[i] + w[i];
+            uint32_t s0 = ROTR(a, 2) ^ ROTR(a, 13) ^ ROTR(a, 22);
+            uint32_t maj = (a & b) ^ (a & c) ^ (b & c);
+            uint32_t t2 = s0 + maj;
+            h = g; g = f; f = e; e = d + t1;
+            d = c; c = b; b = a; a = t1 + t2;
+        }
+
+        state[0] += a; state[1] += b; state[2] += c; state[3] += d;
+        state[4] += e; state[5] += f; state[6] += g; state[7] += h;
+        data += 64;
+    }
+}
+
+#ifdef POW_HAVE_X86
+__attribute__((target("sha,sse4.1,ssse3")))
+static void compress_shani(uint32_t state[8], const uint8_t *data, size_t blocks)
+{
+    const __m128i bswap = _mm_set_epi64x(0x0c0d0e0f08090a0bULL, 0x0405060700010203ULL);
+    __m128i tmp, abef, cdgh;
+
+    /* Rearrange the state into the ABEF / CDGH layout used by SHA256RNDS2. */
+    tmp = _mm_shuffle_epi32(_mm_loadu_si128((const __m128i *)&state[0]), 0xB1);
+    cdgh = _mm_shuffle_epi32(_mm_loadu_si128((const __m128i *)&state[4]), 0x1B);
+    abef = _mm_alignr_epi8(tmp, cdgh, 8);
+    cdgh = _mm_blend_epi16(cdgh, tmp, 0xF0);
+
+    while (blocks--) {
+        const __m128i abef_save = abef, cdgh_save = cdgh;
+        __m128i w[4];
+        int t;
+
+#pragma GCC unroll 16
+        for (t = 0; t < 16; t++) {
+            __m128i m, wk;
+
+            if (t < 4) {
+                m = _mm_shuffle_epi8(_mm_loadu_si128((const __m128i *)(data + 16 * t)), bswap);
+            } else {
+                /* W[t] = sigma1 + W[t-7] + sigma0 + W[t-16], four lanes at a time. */
+                m = _mm_sha256msg1_epu32(w[t & 3], w[(t - 3) & 3]);
+                m = _mm_add_epi32(m, _mm_alignr_epi8(w[(t - 1) & 3], w[(t - 2) & 3], 4));
+                m = _mm_sha256msg2_epu32(m, w[(t - 1) & 3]);
+            }
+            w[t & 3] = m;
+
+            wk = _mm_add_epi32(m, _mm_loadu_si128((const __m128i *)&SHA256_K[4 * t]));
+            cdgh = _mm_sha256rnds2_epu32(cdgh, abef, wk);
+            abef = _mm_sha256rnds2_epu32(abef, cdgh, _mm_shuffle_epi32(wk, 0x0E));
+        }
+
+        abef = _mm_add_epi32(abef, abef_save);
+        cdgh = _mm_add_epi32(cdgh, cdgh_save);
+        data += 64;
+    }
+
+    tmp = _mm_shuffle_epi32(abef, 0x1B);
+    cdgh = _mm_shuffle_epi32(cdgh, 0xB1);
+    _mm_storeu_si128((__m128i *)&state[0], _mm_blend_epi16(tmp, cdgh, 0xF0));
+    _mm_storeu_si128((__m128i *)&state[4], _mm_alignr_epi8(cdgh, tmp, 8));
+}
+
+static int cpu_has_shani(void)
+{
+    unsigned int eax, ebx, ecx, edx;
+
+    if (!__get_cpuid(1, &eax, &ebx, &ecx, &edx) || !(ecx & bit_SSSE3) || !(ecx & bit_SSE4_1))
+        return 0;
+    if (!__get_cpuid_count(7, 0, &eax, &ebx, &ecx, &edx))
+        return 0;
+    return (ebx >> 29) & 1;
+}
+#endif
+
+static compress_fn select_compress(void)
+{
+#if defined(POW_HAVE_X86) && !defined(POW_FORCE_SCALAR)
+    if (cpu_has_shani())
+        return compress_shani;
+#endif
+    return compress_scalar;
+}
+
+/* Number of decimal digits written to `out` (no terminator). */
+static size_t format_u64(uint64_t value, uint8_t *out)
+{
+    uint8_t tmp[20];
+    size_t n = 0, i;
+
+    do {
+        tmp[n++] = (uint8_t)('0' + value % 10);
+        value /= 10;
+    } while (value);
+    for (i = 0; i < n; i++)
+        out[i] = tmp[n - 1 - i];
+    return n;
+}
+
+/* Write the SHA-256 padding for a message of `total` bytes whose tail ends at buf[len]. */
+static size_t pad_tail(uint8_t *buf, size_t len, uint64_t total)
+{
+    size_t blocks = (len + 9 <= 64) ? 1 : 2;
+    uint64_t bits = total * 8;
+    int i;
+
+    buf[len] = 0x80;
+    memset(buf + len + 1, 0, blocks * 64 - len - 9);
+    for (i = 0; i < 8; i++)
+        buf[blocks * 64 - 1 - i] = (uint8_t)(bits >> (8 * i));
+    return blocks;
+}
+
+static int has_zero_nibbles(const uint32_t state[8], uint32_t nibbles)
+{
+    const uint32_t *word = state;
+
+    for (; nibbles >= 8; nibbles -= 8) {
+        if (*word++)
+            return 0;
+    }
+    return nibbles == 0 || (*word >> (32 - 4 * nibbles)) == 0;
+}
+
+/* 1 when the SHA extensions are used, 0 for the scalar fallback. */
+int pow_uses_shani(void)
+{
+    return select_compress() != compress_scalar;
+}
+
+uint64_t find_nonce(const char *prefix, size_t plen, uint64_t start, uint64_t count,
+                    uint32_t zero_nibbles)
+{
+    static compress_fn compress;
+    uint32_t midstate[8], state[8];
+    uint8_t tail[128];
+    size_t full, tail_len, digits, blocks;
+    uint64_t i;
+
+    if (zero_nibbles > 64)
+        return POW_NOT_FOUND;
+    if (!compress)
+        compress = select_compress();
+
+    /* Absorb every complete block of the prefix once. */
+    full = plen / 64;
+    memcpy(midstate, SHA256_IV, sizeof(midstate));
+    compress(midstate, (const uint8_t *)prefix, full);
+
+    tail_len = plen - full * 64;
+    memcpy(tail, prefix + full * 64, tail_len);
+    digits = format_u64(start, tail + tail_len);
+    blocks = pad_tail(tail, tail_len + digits, plen + digits);
+
+    for (i = 0; i < count; i++) {
+        size_t pos;
+
+        memcpy(state, midstate, sizeof(state));
+        compress(state, tail, blocks);
+        if (has_zero_nibbles(state, zero_nibbles))
+            return start + i;
+
+        /* Increment the ASCII nonce in place, growing it on carry out. */
+        pos = tail_len + digits;
+        while (pos > tail_len && tail[pos - 1] == '9')
+            tail[--pos] = '0';
+        if (pos > tail_len) {
+            tail[pos - 1]++;
+        } else {
+            tail[tail_len] = '1';
+            tail[tail_len + digits] = '0';
+            digits++;
+            blocks = pad_tail(tail, tail_len + digits, plen + digits);
+        }
+    }
+    return POW_NOT_FOUND;
+}
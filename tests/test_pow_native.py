@@ -0,0 +1,79 @@
+"""
+Tests for the native proof of work scanner.
+
+find_nonce is checked against a hashlib reference search, with last_proof
+prefixes whose lengths put the nonce digits on either side of SHA-256 block
+boundaries, on both the SHA-NI and the scalar compression paths.
+"""
+
+import hashlib
+import os
+import shutil
+import subprocess
+
+import pytest
+
+import _pow_native
+
+SOURCE = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))),
+                      'pow_sha256_shani.c')
+
+# Prefix lengths around the one- and two-block tail boundaries
+PREFIX_LENGTHS = [55, 63, 64, 100, 119]
+
+pytestmark = pytest.mark.skipif(not _pow_native.available,
+                                reason='native proof of work library not built')
+
+
+def reference_nonce(last_proof: int, difficulty: int, start: int = 0) -> int:
+    """Find the smallest valid proof >= start with hashlib."""
+    prefix = str(last_proof).encode()
+    target = '0' * difficulty
+    nonce = start
+    while not hashlib.sha256(prefix + str(nonce).encode()).hexdigest().startswith(target):
+        nonce += 1
+    return nonce
+
+
+def last_proof_of_length(length: int) -> int:
+    """Build a last_proof whose decimal form has `length` digits."""
+    return int(('123456789' * (length // 9 + 1))[:length])
+
+
+@pytest.fixture(scope='module', params=['default', 'scalar'])
+def native(request, tmp_path_factory):
+    """Yield _pow_native bound to the built library or a scalar-only build."""
+    if request.param == 'default':
+        yield _pow_native
+        return
+
+    compiler = shutil.which('cc')
+    if compiler is None:
+        pytest.skip('no C compiler to build the scalar scanner')
+    path = str(tmp_path_factory.mktemp('pow') / 'pow_scalar.so')
+    subprocess.run([compiler, '-O2', '-shared', '-fPIC', '-DPOW_FORCE_SCALAR',
+                    '-o', path, SOURCE], check=True)
+
+    monkeypatch = pytest.MonkeyPatch()
+    monkeypatch.setenv('POW_NATIVE_LIB', path)
+    lib = _pow_native._load_library()
+    assert not lib.pow_uses_shani()
+    monkeypatch.setattr(_pow_native, '_lib', lib)
+    yield _pow_native
+    monkeypatch.undo()
+
+
+@pytest.mark.parametrize('length', PREFIX_LENGTHS)
+@pytest.mark.parametrize('difficulty', range(5))
+def test_find_nonce_matches_hashlib(native, length, difficulty):
+    last_proof = last_proof_of_length(length)
+    assert native.find_nonce(last_proof, difficulty) == reference_nonce(last_proof, difficulty)
+
+
+@pytest.mark.parametrize('length', PREFIX_LENGTHS)
+def test_find_nonce_across_digit_carry(native, length):
+    # Starting just below a power of ten makes the nonce grow a digit
+    # mid-search, which can move the padding into a second block
+    last_proof = last_proof_of_length(length)
+    start = 99990
+    assert native.find_nonce(last_proof, 2, start) == reference_nonce(last_proof, 2, start)
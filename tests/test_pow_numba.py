@@ -0,0 +1,46 @@
+"""
+Tests for the Numba proof of work backend.
+
+search runs its own SHA-256 over parallel nonce chunks with a racy early
+exit, and Numba does no bounds checking, so it is checked against the
+smallest valid proof found sequentially with hashlib.
+"""
+
+import hashlib
+
+import pytest
+
+import _pow_numba
+
+pytestmark = pytest.mark.skipif(not _pow_numba.available, reason='numba not installed')
+
+
+def reference_nonce(last_proof: int, difficulty: int) -> int:
+    """Find the smallest valid proof with hashlib."""
+    prefix = str(last_proof).encode()
+    target = '0' * difficulty
+    nonce = 0
+    while not hashlib.sha256(prefix + str(nonce).encode()).hexdigest().startswith(target):
+        nonce += 1
+    return nonce
+
+
+def last_proof_of_length(length: int) -> int:
+    """Build a last_proof whose decimal form has `length` digits."""
+    return int(('123456789' * (length // 9 + 1))[:length])
+
+
+@pytest.mark.parametrize('length', [1, 55, 63, 64, 100, 119])
+@pytest.mark.parametrize('difficulty', range(5))
+def test_search_matches_hashlib_minimum(length, difficulty):
+    last_proof = last_proof_of_length(length)
+    assert _pow_numba.search(last_proof, difficulty) == reference_nonce(last_proof, difficulty)
+
+
+def test_search_beyond_first_chunk():
+    # A proof past CHUNK_SIZE means several chunks hit or race to the
+    # early exit; the smallest one must still win
+    last_proof = 100
+    expected = reference_nonce(last_proof, 5)
+    assert expected > _pow_numba.CHUNK_SIZE
+    assert _pow_numba.search(last_proof, 5) == expected
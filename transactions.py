@@ -0,0 +1,145 @@
+"""
+Transactions Module
+
+This module provides the pending transaction pool used by the blockchain.
+Transactions are stored column-wise (one list per field) instead of as one
+dictionary per transaction, and are only materialized as dictionaries when
+they are put into a block or rendered.
+"""
+
+from dataclasses import dataclass, field
+from typing import Any, Dict, Iterator, List, Optional, Union
+
+# Default maximum number of pending transactions
+MAX_MEMPOOL = 100000
+
+
+@dataclass
+class Transactions:
+    """
+    Structure-of-arrays pool of pending transactions.
+
+    The columns are preallocated ring buffers of `capacity` slots: appending
+    fills the slot after the last pending transaction, and draining the pool
+    into a block frees the slots for reuse, so memory stays bounded no matter
+    how many transactions are submitted.
+
+    Iterating yields each transaction as a dictionary, so the pool can be
+    used wherever a list of transaction dictionaries is expected.
+    """
+    capacity: int = MAX_MEMPOOL
+    senders: List[Optional[str]] = field(init=False, repr=False)
+    recipients: List[Optional[str]] = field(init=False, repr=False)
+    amounts: List[Optional[Union[int, float]]] = field(init=False, repr=False)
+    timestamps: List[Any] = field(init=False, repr=False)
+    # Additional transaction data by slot, only for transactions that have any
+    extras: Dict[int, Dict] = field(init=False, repr=False, default_factory=dict)
+    # Slot of the oldest pending transaction, and number of pending transactions
+    head: int = field(init=False, default=0)
+    size: int = field(init=False, default=0)
+
+    def __post_init__(self):
+        self.senders = [None] * self.capacity
+        self.recipients = [None] * self.capacity
+        self.amounts = [None] * self.capacity
+        self.timestamps = [None] * self.capacity
+
+    def __len__(self) -> int:
+        return self.size
+
+    def __getitem__(self, i: int) -> Dict:
+        return self._materialize(self._slot(range(self.size)[i]))
+
+    def __iter__(self) -> Iterator[Dict]:
+        for i in range(self.size):
+            yield self._materialize(self._slot(i))
+
+    def append(self, sender: str, recipient: str, amount: Union[int, float],
+               timestamp: Any, extra: Optional[Dict] = None) -> None:
+        """
+        Add a transaction to the pool.
+
+        Args:
+            sender: Address of the sender
+            recipient: Address of the recipient
+            amount: Amount being transferred
+            timestamp: Time the transaction was created
+            extra: Additional transaction data (optional)
+
+        Raises:
+            ValueError: If the pool is full
+        """
+        if self.size == self.capacity:
+            raise ValueError('Mempool is full')
+
+        slot = self._slot(self.size)
+        if extra:
+            self.extras[slot] = extra
+        self.senders[slot] = sender
+        self.recipients[slot] = recipient
+        self.amounts[slot] = amount
+        self.timestamps[slot] = timestamp
+        self.size += 1
+
+    def contains(self, sender: str, recipient: str, amount: Union[int, float],
+                 extra: Optional[Dict] = None) -> bool:
+        """
+        Check whether an identical transaction is already in the pool.
+
+        Args:
+            sender: Address of the sender
+            recipient: Address of the recipient
+            amount: Amount being transferred
+            extra: Additional transaction data (optional)
+
+        Returns:
+            True if a transaction with the same data is pending, False if not
+        """
+        extra = extra or {}
+        for i in range(self.size):
+            slot = self._slot(i)
+            if (self.senders[slot] == sender and self.recipients[slot] == recipient and
+                    self.amounts[slot] == amount and self.extras.get(slot, {}) == extra):
+                return True
+        return False
+
+    def to_list(self) -> List[Dict]:
+        """
+        Materialize the pool as a list of transaction dictionaries.
+
+        Returns:
+            The pending transactions in insertion order
+        """
+        return list(self)
+
+    def drain(self) -> List[Dict]:
+        """
+        Remove all pending transactions from the pool.
+
+        Returns:
+            The removed transactions in insertion order
+        """
+        transactions = self.to_list()
+        for i in range(self.size):
+            slot = self._slot(i)
+            # Drop references so drained transactions can be freed
+            self.senders[slot] = self.recipients[slot] = None
+            self.amounts[slot] = self.timestamps[slot] = None
+        self.extras.clear()
+        self.head = self._slot(self.size)
+        self.size = 0
+        return transactions
+
+    def _slot(self, i: int) -> int:
+        """Return the buffer slot of the i-th pending transaction."""
+        return (self.head + i) % self.capacity
+
+    def _materialize(self, slot: int) -> Dict:
+        """Build the dictionary for the transaction in a slot."""
+        return {
+            'sender': self.senders[slot],
+            'recipient': self.recipients[slot],
+            'amount': self.amounts[slot],
+            'timestamp': self.timestamps[slot],
+            **self.extras.get(slot, {})  # Include any additional transaction data
+        }
@@ -0,0 +1,10 @@
+"""
+WSGI entry point for the Blockchain API Application.
+
+The blockchain lives in process memory, so run a single worker process and
+scale with threads:
+
+    gunicorn -w 1 -k gthread --threads 8 -b 0.0.0.0:5000 wsgi:app
+"""
+
+from app import app